@@ -219,6 +219,17 @@ class QualityReport:
         with dp.FileClient.gcs_open(path, "w") as outfile:
             json.dump(self.to_dict(), outfile)
 
+    def save_control_documentation(self, path: str) -> None:
+        """Save the control documentation of the report as a parquet file to the specified path.
+
+        The parquet file can be read column by column, which makes it faster to load
+        than the full JSON report when only the control documentation is needed.
+
+        Args:
+            path (str): The file path where the control documentation will be saved.
+        """
+        dp.write_pandas(create_control_documentation(self), path, file_format="parquet")
+
     @classmethod
     def from_json(cls, path: str) -> "QualityReport":
         """Initialize a QualityReport from a saved JSON file.
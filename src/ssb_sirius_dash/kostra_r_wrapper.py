@@ -1,33 +1,38 @@
 import logging
 import timeit
+from typing import TYPE_CHECKING
 
 import pandas as pd
-from rpy2.robjects import conversion
-from rpy2.robjects import default_converter
-from rpy2.robjects import pandas2ri
-from rpy2.robjects.packages import InstalledSTPackage
-from rpy2.robjects.packages import importr
+
+if TYPE_CHECKING:
+    from rpy2.robjects.packages import InstalledSTPackage
 
 logger = logging.getLogger(__name__)
 
 # Global variable to store the R package Kostra
-_kostra_r: InstalledSTPackage | None = None
+_kostra_r: "InstalledSTPackage | None" = None
 
 
-def _get_kostra_r() -> InstalledSTPackage:
+def _get_kostra_r() -> "InstalledSTPackage":
     """Loads the R package Kostra.
 
+    rpy2 is imported here rather than at module level, so that R is only started
+    when one of the Kostra methods is used.
+
     :return: Kostra R package
     """
+    global _kostra_r
     if _kostra_r is not None:
         return _kostra_r
 
+    from rpy2.robjects.packages import importr
+
     start_time = timeit.default_timer()
-    globals()["_kostra_r"] = importr("Kostra")
+    _kostra_r = importr("Kostra")
     logger.info(
         "Finished loading Kostra in %3g seconds", (timeit.default_timer() - start_time)
     )
-    return globals()["_kostra_r"]
+    return _kostra_r
 
 
 def th_error(
@@ -41,6 +46,10 @@ def th_error(
     :param x_2_field_name: The name of the second x field
     :return: The result of the method
     """
+    from rpy2.robjects import conversion
+    from rpy2.robjects import default_converter
+    from rpy2.robjects import pandas2ri
+
     with conversion.localconverter(default_converter + pandas2ri.converter):
         th_error_result = _get_kostra_r().ThError(
             data=data, id=id_field_name, x1=x_1_field_name, x2=x_2_field_name
@@ -68,6 +77,10 @@ def hb_method(
     :param x_2_field_name: The name of the second x field
     :return: The result of the method
     """
+    from rpy2.robjects import conversion
+    from rpy2.robjects import default_converter
+    from rpy2.robjects import pandas2ri
+
     with conversion.localconverter(default_converter + pandas2ri.converter):
         return _get_kostra_r().Hb(
             data=data,
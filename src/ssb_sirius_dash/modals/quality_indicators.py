@@ -1,9 +1,18 @@
 import logging
+import threading
+from collections import Counter
+from collections import defaultdict
 from collections.abc import Callable
+from collections.abc import Hashable
+from functools import cached_property
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
+from typing import cast
 
 import dash_ag_grid as dag
 import dash_bootstrap_components as dbc
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -16,6 +25,7 @@ from dash import html
 from dash.exceptions import PreventUpdate
 
 from ..control.framework import QualityReport
+from ..control.framework import create_control_documentation
 from ..utils.functions import sidebar_button
 
 logger = logging.getLogger(__name__)
@@ -24,6 +34,138 @@ logger.warning(
     "This module is still in early development. Names for classes/functions in this module are subject to change with little warning."
 )
 
+_CARD_STYLE = {
+    "width": "18rem",
+    "margin": "10px",
+}
+
+_KONTROLLUTSLAGSANDEL_COLUMNS = (
+    "kontroll_id",
+    "kontrollutslagsandel",
+    "Enheter kontrollert",
+    "Kontrollutslag",
+)
+
+
+@lru_cache(maxsize=32)
+def _dropdown_options(columns: tuple[str, ...]) -> list[dict[str, str]]:
+    """Creates dropdown options for selecting between columns.
+
+    Args:
+        columns (tuple[str, ...]): The columns to choose between.
+
+    Returns:
+        list[dict[str, str]]: The dropdown options, shared between calls with the same columns.
+    """
+    return [{"label": x, "value": x} for x in columns]
+
+
+def _read_json_report(path: str) -> dict[str, Any]:
+    """Reads a quality report saved in JSON format on Dapla.
+
+    Uses `orjson` to parse the file if it is installed, which is considerably faster
+    than the standard library for large reports.
+
+    Args:
+        path (str): File path to the saved quality report.
+
+    Returns:
+        dict[str, Any]: The quality report as a dictionary.
+    """
+    import dapla as dp
+
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        with dp.FileClient.gcs_open(path, "r") as outfile:
+            data: dict[str, Any] = json.load(outfile)
+        return data
+
+    with dp.FileClient.gcs_open(path, "rb") as outfile:
+        data = orjson.loads(outfile.read())
+    return data
+
+
+class _SharedData:
+    """Lock-protected memo for the data functions shared between quality indicators.
+
+    Each function is called at most once until the memo is cleared, also when several
+    callbacks ask for its data at the same time.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty memo."""
+        self._lock = threading.Lock()
+        self._func_locks: dict[Callable[..., pd.DataFrame], threading.Lock] = {}
+        self._data: dict[Callable[..., pd.DataFrame], pd.DataFrame] = {}
+
+    def get(self, func: Callable[..., pd.DataFrame]) -> pd.DataFrame:
+        """Returns the data from a data function, calling it only if it is not already stored.
+
+        Args:
+            func (Callable): The data function.
+
+        Returns:
+            pd.DataFrame: The data returned by the function.
+        """
+        with self._lock:
+            func_lock = self._func_locks.setdefault(func, threading.Lock())
+        with func_lock:
+            with self._lock:
+                data = self._data.get(func)
+            if data is None:
+                data = func()
+                with self._lock:
+                    self._data[func] = data
+            return data
+
+    def clear(self) -> None:
+        """Removes all stored data, so that the data functions are called again."""
+        with self._lock:
+            self._data.clear()
+
+
+def _get_data(
+    shared_data: _SharedData | None, func: Callable[..., pd.DataFrame]
+) -> pd.DataFrame:
+    """Gets the data from a data function, through the shared memo if the indicator has one.
+
+    Args:
+        shared_data (_SharedData | None): The memo of the quality indicator modal, if any.
+        func (Callable): The data function.
+
+    Returns:
+        pd.DataFrame: The data returned by the function.
+    """
+    if shared_data is None:
+        return func()
+    return shared_data.get(func)
+
+
+def _indicator_figure(value: float) -> go.Figure:
+    """Creates the figure showing the value of a quality indicator on its card.
+
+    Args:
+        value (float): The value of the quality indicator.
+
+    Returns:
+        go.Figure: A figure with a single number indicator.
+    """
+    return go.Figure(
+        go.Indicator(
+            mode="number+delta",
+            value=value,
+            number={"prefix": ""},
+            # delta={"position": "bottom", "reference": value_previous_periode}, # TODO
+            domain={"x": [0, 1], "y": [0, 1]},
+        )
+    ).update_layout(
+        height=150,
+        margin=dict(l=20, r=20, t=20, b=20),
+    )
+
 
 class QualityIndicator:
     """A module for setting up the view for selected quality indicators.
@@ -35,6 +177,10 @@ class QualityIndicator:
     Notes:
         All indicators assume a long format for the data with a minimum of
         `ident`, `variabel`, and `verdi` as columns.
+
+        Data functions that are shared between indicators are only called once each
+        time the modal is opened. The returned data is shared between the indicators
+        and should not be modified by them. It is released when the modal is closed.
     """
 
     def __init__(self, indicators: list[Any]) -> None:
@@ -52,6 +198,12 @@ class QualityIndicator:
                     f"Object '{type(indicator)}' has no attribute 'card', which is necessary for the indicator to be rendered in the layout."
                 )
         self.indicators = indicators
+        # Indicators often get their data from the same functions, so they read it
+        # through one memo that calls each function once per opening of the modal.
+        self._shared_data = _SharedData()
+        for indicator in indicators:
+            if hasattr(indicator, "_shared_data"):
+                indicator._shared_data = self._shared_data
         self.callbacks()
 
     def layout(self) -> html.Div:
@@ -85,11 +237,12 @@ class QualityIndicator:
                 sidebar_button(
                     "🎯", "Quality indicators", "sidebar-kvalitetsindikatorer-button"
                 ),
+                dcc.Store(id="kvalitetsindikatorer-data-cleared"),
             ]
         )
 
     def callbacks(self) -> None:
-        """Registers callbacks to enable the modal to be opened and closed."""
+        """Registers callbacks to enable the modal to be opened and closed, and to release the shared data."""
 
         @callback(  # type: ignore[misc]
             Output("kvalitetsindikatorer-modal", "is_open"),
@@ -107,47 +260,99 @@ class QualityIndicator:
                 bool: The new state of the modal.
             """
             if n:
+                if not is_open:
+                    self._shared_data.clear()
                 return not is_open
             return is_open
 
+        @callback(  # type: ignore[misc]
+            Output("kvalitetsindikatorer-data-cleared", "data"),
+            Input("kvalitetsindikatorer-modal", "is_open"),
+            prevent_initial_call=True,
+        )
+        def kvalitetsindikatorermodal_release_data(is_open: bool) -> None:
+            """Releases the shared data when the modal is closed.
+
+            The detail views are inside the modal, so nothing needs the data after it
+            is closed, whether by the sidebar button or by the modal itself.
+
+            Args:
+                is_open (bool): The new state of the modal.
+
+            Raises:
+                PreventUpdate: Always, as the callback only releases the data.
+            """
+            if not is_open:
+                self._shared_data.clear()
+            raise PreventUpdate
+
 
 class QualityIndicatorEditeringsandel:
     """Quality indicator for editing ratio.
 
     Attributes:
         get_current_data_func (Callable): Function to retrieve current data.
-        get_change_data_func (Callable): Function to retrieve rows with changes.
+        get_change_data_func (Callable | None): Function to retrieve rows with changes.
         periode: Current period for the data.
         var_name (str): The name of the column in the dataset indicating the variable.
         ident_var (str): Name of the identification variable. For example, "orgf".
         grouping_vars (list[str]): Variables by which the dataset can be grouped, such as "nace" or "kommune".
         key_vars (list[str]): Key variables relevant to the quality indicator.
+        change_flag_var (str | None): Name of a boolean column in the current data marking rows with changes.
+        get_unit_counts_func (Callable | None): Function that counts units and edited units at the data source.
     """
 
     def __init__(
         self,
         get_current_data_func: Callable[..., pd.DataFrame],
-        get_change_data_func: Callable[..., pd.DataFrame],
+        get_change_data_func: Callable[..., pd.DataFrame] | None,
         var_name: str,
         ident_var: str,
         grouping_vars: list[str] | None = None,
         key_vars: list[str] | None = None,
+        change_flag_var: str | None = None,
+        get_unit_counts_func: Callable[[list[str]], pd.DataFrame] | None = None,
     ) -> None:
         """Initializes the editing ratio view for the quality indicator modal.
 
         Args:
             get_current_data_func (Callable): Function to retrieve current data.
-            get_change_data_func (Callable): Function to retrieve rows with changes.
+            get_change_data_func (Callable | None): Function to retrieve rows with changes.
+                Can be None if `change_flag_var` is provided.
             var_name (str): Name of the variable column in the dataset.
             ident_var (str): Name of the identification variable.
             grouping_vars (list[str], optional): Variables for dataset grouping. Defaults to None.
             key_vars (list[str], optional): Key variables for the indicator. Defaults to None.
+            change_flag_var (str | None, optional): Boolean column in the current data that is True for
+                rows with changes. Missing values are counted as unchanged. If provided, both unit
+                counts are taken from the current data in one pass instead of fetching the change
+                data separately. Defaults to None.
+            get_unit_counts_func (Callable | None, optional): Function that counts the units at the
+                data source, for example with `COUNT(DISTINCT ...)` in SQL. It is called with a list
+                of grouping variables, which is empty for the total, and must return a DataFrame
+                with the grouping variables and the columns `units` and `edited_units`. If provided,
+                it is used instead of retrieving and counting the data locally. Defaults to None.
+
+        Raises:
+            ValueError: If none of `get_change_data_func`, `change_flag_var` and
+                `get_unit_counts_func` is provided.
         """
+        if (
+            get_change_data_func is None
+            and change_flag_var is None
+            and get_unit_counts_func is None
+        ):
+            raise ValueError(
+                "Either get_change_data_func, change_flag_var or get_unit_counts_func needs to have a value."
+            )
         self.ident_var = ident_var
         self.var_name = var_name
         self.grouping_vars = grouping_vars if grouping_vars else []
         self.get_current_data = get_current_data_func
         self.get_change_data = get_change_data_func
+        self.change_flag_var = change_flag_var
+        self.get_unit_counts = get_unit_counts_func
+        self._shared_data: _SharedData | None = None
         if key_vars:
             self.key_vars = key_vars  # TODO
 
@@ -161,20 +366,13 @@ class QualityIndicatorEditeringsandel:
                             [
                                 html.H5("1 - Editeringsandel", className="card-title"),
                                 dcc.Graph(
-                                    figure=go.Figure(
-                                        go.Indicator(
-                                            mode="number+delta",
-                                            value=self.editeringsandel(),
-                                            number={"prefix": ""},
-                                            # delta={"position": "bottom", "reference": self.editeringsandel(self.periode-1)}, # TODO
-                                            domain={"x": [0, 1], "y": [0, 1]},
-                                        )
-                                    ).update_layout(
-                                        height=150,
-                                        margin=dict(l=20, r=20, t=20, b=20),
-                                    ),
+                                    id="kvalitet-editeringsandel-indicator",
+                                    figure=_indicator_figure(0),
                                     config={"displayModeBar": False},
                                 ),
+                                dcc.Store(
+                                    id="kvalitet-editeringsandel-computed", data=False
+                                ),
                             ]
                         ),
                         dbc.CardFooter(
@@ -184,10 +382,7 @@ class QualityIndicatorEditeringsandel:
                             )
                         ),
                     ],
-                    style={
-                        "width": "18rem",
-                        "margin": "10px",
-                    },
+                    style=_CARD_STYLE,
                 ),
                 dbc.Modal(
                     [
@@ -198,10 +393,9 @@ class QualityIndicatorEditeringsandel:
                                     children=[
                                         dcc.Dropdown(
                                             id="kvalitet-editeringsandel-dropdown",
-                                            options=[
-                                                {"label": x, "value": x}
-                                                for x in [var_name, *self.grouping_vars]
-                                            ],
+                                            options=_dropdown_options(
+                                                (var_name, *self.grouping_vars)
+                                            ),
                                         )
                                     ],
                                 ),
@@ -220,11 +414,35 @@ class QualityIndicatorEditeringsandel:
         """Calculates the editing ratio.
 
         Returns:
-            float: The editing ratio as a percentage.
+            float: The editing ratio as a percentage. 0 if there are no units in the current data.
+
+        Raises:
+            ValueError: If no source for the edited units is set.
         """
-        total = pd.DataFrame(self.get_current_data().agg({self.ident_var: "nunique"}))
-        changes = pd.DataFrame(self.get_change_data().agg({self.ident_var: "nunique"}))
-        return float((changes / total * 100).iloc[0][0])
+        if self.get_unit_counts is not None:
+            counts = self.get_unit_counts([])
+            total = counts["units"].sum()
+            changes = counts["edited_units"].sum()
+        elif self.change_flag_var is not None:
+            data = _get_data(self._shared_data, self.get_current_data)[
+                [self.ident_var, self.change_flag_var]
+            ]
+            total = data[self.ident_var].nunique()
+            changes = data.loc[
+                data[self.change_flag_var].fillna(False).astype(bool), self.ident_var
+            ].nunique()
+        elif self.get_change_data is not None:
+            total = _get_data(self._shared_data, self.get_current_data)[
+                self.ident_var
+            ].nunique()
+            changes = _get_data(self._shared_data, self.get_change_data)[
+                self.ident_var
+            ].nunique()
+        else:
+            raise ValueError(
+                "Either get_change_data_func, change_flag_var or get_unit_counts_func needs to have a value."
+            )
+        return changes / total * 100.0 if total else 0.0
 
     def editeringsandel_details(self, group: list[str] | str) -> pd.DataFrame:
         """Calculates the editing ratio for different subsets of the dataset.
@@ -234,27 +452,80 @@ class QualityIndicatorEditeringsandel:
 
         Returns:
             pd.DataFrame: A DataFrame with editing ratios for each subset.
+
+        Raises:
+            ValueError: If no source for the edited units is set.
         """
         if isinstance(group, str):
             group = [group]
-        total = (
-            self.get_current_data()
-            .groupby(group)
-            .agg({self.ident_var: "nunique"})
-            .rename(columns={self.ident_var: "units"})
-        )
-        changes = (
-            self.get_change_data()
-            .groupby(group)
-            .agg({self.ident_var: "nunique"})
-            .rename(columns={self.ident_var: "edited_units"})
-        )
-        c = pd.merge(total, changes, on=group, how="left").fillna(0)
+        if self.get_unit_counts is not None:
+            c = self.get_unit_counts(group).set_index(group)
+        elif self.change_flag_var is not None:
+            current_data = _get_data(self._shared_data, self.get_current_data)
+            # Identifiers of unchanged rows are masked as missing, which nunique
+            # ignores, so both counts come from a single grouped reduction.
+            c = (
+                current_data[group]
+                .assign(
+                    units=current_data[self.ident_var],
+                    edited_units=current_data[self.ident_var].where(
+                        current_data[self.change_flag_var].fillna(False).astype(bool)
+                    ),
+                )
+                .groupby(group, observed=True, sort=False)
+                .agg({"units": "nunique", "edited_units": "nunique"})
+            )
+        elif self.get_change_data is not None:
+            total = (
+                _get_data(self._shared_data, self.get_current_data)
+                .groupby(group, observed=True, sort=False)
+                .agg({self.ident_var: "nunique"})
+                .rename(columns={self.ident_var: "units"})
+            )
+            changes = (
+                _get_data(self._shared_data, self.get_change_data)
+                .groupby(group, observed=True, sort=False)
+                .agg({self.ident_var: "nunique"})
+                .rename(columns={self.ident_var: "edited_units"})
+            )
+            c = total.join(changes, how="left").fillna(0)
+        else:
+            raise ValueError(
+                "Either get_change_data_func, change_flag_var or get_unit_counts_func needs to have a value."
+            )
         c["editeringsandel"] = c["edited_units"] / c["units"] * 100
         return c.reset_index()
 
     def callbacks(self) -> None:
-        """Sets up callbacks for opening the detail view and selecting grouping for details."""
+        """Sets up callbacks for the indicator value, opening the detail view and selecting grouping for details."""
+
+        @callback(  # type: ignore[misc]
+            Output("kvalitet-editeringsandel-indicator", "figure"),
+            Output("kvalitet-editeringsandel-computed", "data"),
+            Input("kvalitetsindikatorer-modal", "is_open"),
+            State("kvalitet-editeringsandel-computed", "data"),
+            prevent_initial_call=True,
+        )
+        def kvalitetediteringsandel_indicator(
+            is_open: bool, computed: bool
+        ) -> tuple[go.Figure, bool]:
+            """Calculates the editing ratio shown on the card the first time the quality indicator modal is opened.
+
+            Args:
+                is_open (bool): Whether the quality indicator modal is open.
+                computed (bool): Whether the card has already been calculated.
+
+            Returns:
+                tuple[go.Figure, bool]:
+                    - Figure showing the editing ratio.
+                    - True, to mark the card as calculated.
+
+            Raises:
+                PreventUpdate: If the modal is being closed or the card has already been calculated.
+            """
+            if not is_open or computed:
+                raise PreventUpdate
+            return _indicator_figure(self.editeringsandel()), True
 
         @callback(  # type: ignore[misc]
             Output("editeringsandel-modal", "is_open"),
@@ -312,8 +583,9 @@ class QualityIndicatorKontrollutslagsandel:
     `kontroll_id`, `Enheter kontrollert`, `Kontrollutslag`.
 
     Attributes:
-        control_documentation (QualityReport | None): The quality report used for calculations.
-        qualityreport_path (str | None): File path to a saved quality report in JSON format on Dapla.
+        control_documentation (pd.DataFrame): The control documentation used for calculations.
+        qualityreport_path (str | None): File path to a saved quality report in JSON format on Dapla,
+            or to control documentation saved as parquet with `QualityReport.save_control_documentation()`.
     """
 
     def __init__(
@@ -325,38 +597,45 @@ class QualityIndicatorKontrollutslagsandel:
 
         Args:
             control_documentation (QualityReport | None): A quality report for calculation.
-            qualityreport_path (str | None): File path to a saved quality report in JSON format.
+            qualityreport_path (str | None): File path to a saved quality report in JSON format,
+                or to control documentation in parquet format. Only the necessary columns are read
+                from a parquet file.
 
         Raises:
             ValueError: If both `control_documentation` and `qualityreport_path` are defined,
                         or if neither is provided.
         """
-        if qualityreport_path and control_documentation:
+        if qualityreport_path and control_documentation is not None:
             raise ValueError(
                 "Remove either control_documentation or qualityreport_path. QualityIndicatorTreffsikkerhet() requires that only one of control_documentation and qualityreport_path is defined. If both are defined, it will not work."
             )
-        if qualityreport_path:
-            import json
-
+        self.control_documentation: pd.DataFrame
+        if qualityreport_path and Path(qualityreport_path).suffix.lower() == ".parquet":
             import dapla as dp
 
-            with dp.FileClient.gcs_open(qualityreport_path, "r") as outfile:
-                data = json.load(outfile)
+            self.control_documentation = cast(
+                pd.DataFrame,
+                dp.read_pandas(
+                    qualityreport_path,
+                    file_format="parquet",
+                    columns=["kontroll_id", "Enheter kontrollert", "Kontrollutslag"],
+                ),
+            )
+        elif qualityreport_path:
+            data = _read_json_report(qualityreport_path)
             self.control_documentation = (
-                pd.DataFrame(data["control_documentation"])
-                .T.reset_index()
-                .rename(columns={"index": "kontroll_id"})
+                pd.DataFrame.from_dict(data["control_documentation"], orient="index")
+                .rename_axis("kontroll_id")
+                .reset_index()
+            )
+        elif control_documentation is not None:
+            self.control_documentation = create_control_documentation(
+                control_documentation
             )
-        elif control_documentation:
-            self.control_documentation = control_documentation
         else:
             raise ValueError(
                 "Either control_documentation or qualityreport_path needs to have a value."
             )
-        self.kontrollutslagsandel_total, self.kontrollutslagsandel_detaljer = (
-            self.kontrollutslag()
-        )
-
         self.callbacks()
 
         self.card = html.Div(
@@ -369,20 +648,14 @@ class QualityIndicatorKontrollutslagsandel:
                                     "2 - Kontrollutslagsandel", className="card-title"
                                 ),
                                 dcc.Graph(
-                                    figure=go.Figure(
-                                        go.Indicator(
-                                            mode="number+delta",
-                                            value=self.kontrollutslagsandel_total,
-                                            number={"prefix": ""},
-                                            # delta={"position": "bottom", "reference": self.editeringsandel(self.periode-1)}, # TODO
-                                            domain={"x": [0, 1], "y": [0, 1]},
-                                        )
-                                    ).update_layout(
-                                        height=150,
-                                        margin=dict(l=20, r=20, t=20, b=20),
-                                    ),
+                                    id="kvalitet-kontrollutslagsandel-indicator",
+                                    figure=_indicator_figure(0),
                                     config={"displayModeBar": False},
                                 ),
+                                dcc.Store(
+                                    id="kvalitet-kontrollutslagsandel-computed",
+                                    data=False,
+                                ),
                             ]
                         ),
                         dbc.CardFooter(
@@ -392,10 +665,7 @@ class QualityIndicatorKontrollutslagsandel:
                             )
                         ),
                     ],
-                    style={
-                        "width": "18rem",
-                        "margin": "10px",
-                    },
+                    style=_CARD_STYLE,
                 ),
                 dbc.Modal(
                     [
@@ -405,25 +675,12 @@ class QualityIndicatorKontrollutslagsandel:
                                 html.Div(
                                     children=[
                                         dag.AgGrid(
+                                            id="kvalitet-kontrollutslagsandel-grid",
                                             columnDefs=[
                                                 {"field": x}
-                                                for x in self.kontrollutslagsandel_detaljer[
-                                                    [
-                                                        "kontroll_id",
-                                                        "kontrollutslagsandel",
-                                                        "Enheter kontrollert",
-                                                        "Kontrollutslag",
-                                                    ]
-                                                ].columns
+                                                for x in _KONTROLLUTSLAGSANDEL_COLUMNS
                                             ],
-                                            rowData=self.kontrollutslagsandel_detaljer[
-                                                [
-                                                    "kontroll_id",
-                                                    "kontrollutslagsandel",
-                                                    "Enheter kontrollert",
-                                                    "Kontrollutslag",
-                                                ]
-                                            ].to_dict("records"),
+                                            rowData=[],
                                         )
                                     ],
                                 ),
@@ -446,20 +703,59 @@ class QualityIndicatorKontrollutslagsandel:
                 - The total proportion of control outcomes as a float.
                 - A DataFrame with detailed proportions for each control.
         """
-        total = (
-            self.control_documentation["Kontrollutslag"].sum()
-            / self.control_documentation["Enheter kontrollert"].sum()
-        )
-
-        self.control_documentation["kontrollutslagsandel"] = (
-            self.control_documentation["Kontrollutslag"]
-            / self.control_documentation["Enheter kontrollert"]
+        # Columns may come back as object dtype from a transposed control
+        # documentation, so they are converted to float once before dividing.
+        kontrollutslag = self.control_documentation["Kontrollutslag"].to_numpy(
+            dtype=float
         )
+        enheter_kontrollert = self.control_documentation[
+            "Enheter kontrollert"
+        ].to_numpy(dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            total = float(kontrollutslag.sum() / enheter_kontrollert.sum())
+            self.control_documentation["kontrollutslagsandel"] = (
+                kontrollutslag / enheter_kontrollert
+            )
 
         return total, self.control_documentation
 
     def callbacks(self) -> None:
-        """Sets up callbacks for opening and closing the detailed view."""
+        """Sets up callbacks for the indicator value and details, and for opening and closing the detailed view."""
+
+        @callback(  # type: ignore[misc]
+            Output("kvalitet-kontrollutslagsandel-indicator", "figure"),
+            Output("kvalitet-kontrollutslagsandel-grid", "rowData"),
+            Output("kvalitet-kontrollutslagsandel-computed", "data"),
+            Input("kvalitetsindikatorer-modal", "is_open"),
+            State("kvalitet-kontrollutslagsandel-computed", "data"),
+            prevent_initial_call=True,
+        )
+        def kvalitetkontrollutslagsandel_indicator(
+            is_open: bool, computed: bool
+        ) -> tuple[go.Figure, list[dict[Hashable, Any]], bool]:
+            """Calculates the control outcome ratios the first time the quality indicator modal is opened.
+
+            Args:
+                is_open (bool): Whether the quality indicator modal is open.
+                computed (bool): Whether the card has already been calculated.
+
+            Returns:
+                tuple[go.Figure, list[dict[Hashable, Any]], bool]:
+                    - Figure showing the total control outcome ratio.
+                    - Rows with the control outcome ratio for each control.
+                    - True, to mark the card as calculated.
+
+            Raises:
+                PreventUpdate: If the modal is being closed or the card has already been calculated.
+            """
+            if not is_open or computed:
+                raise PreventUpdate
+            total, detaljer = self.kontrollutslag()
+            return (
+                _indicator_figure(total),
+                detaljer[list(_KONTROLLUTSLAGSANDEL_COLUMNS)].to_dict("records"),
+                True,
+            )
 
         @callback(  # type: ignore[misc]
             Output("kontrollutslagsandel-modal", "is_open"),
@@ -514,6 +810,7 @@ class QualityIndicatorEffektaveditering:
         """
         self.get_current_data = get_current_data_func
         self.get_original_data = get_original_data_func
+        self._shared_data: _SharedData | None = None
         self.periode = periode
         self.ident_var = ident_var
         self.key_vars = key_vars
@@ -533,22 +830,11 @@ class QualityIndicatorEffektaveditering:
                                     "4 - Effekten av editering", className="card-title"
                                 ),
                                 dcc.Graph(
-                                    figure=go.Figure(
-                                        go.Indicator(
-                                            mode="number+delta",
-                                            value=self.get_comparison_data(
-                                                self.periode
-                                            )["effekt av editering"][0],
-                                            number={"prefix": ""},
-                                            # delta={"position": "bottom", "reference": self.editeringsandel(self.periode-1)}, # TODO
-                                            domain={"x": [0, 1], "y": [0, 1]},
-                                        )
-                                    ).update_layout(
-                                        height=150,
-                                        margin=dict(l=20, r=20, t=20, b=20),
-                                    ),
+                                    id="kvalitet-effekt-indicator",
+                                    figure=_indicator_figure(0),
                                     config={"displayModeBar": False},
                                 ),
+                                dcc.Store(id="kvalitet-effekt-computed", data=False),
                             ]
                         ),
                         dbc.CardFooter(
@@ -558,10 +844,7 @@ class QualityIndicatorEffektaveditering:
                             )
                         ),
                     ],
-                    style={
-                        "width": "18rem",
-                        "margin": "10px",
-                    },
+                    style=_CARD_STYLE,
                 ),
                 dbc.Modal(
                     [
@@ -572,10 +855,9 @@ class QualityIndicatorEffektaveditering:
                                     children=[
                                         dcc.Dropdown(
                                             id="kvalitet-effekt-dropdown",
-                                            options=[
-                                                {"label": x, "value": x}
-                                                for x in [*grouping_vars]
-                                            ],
+                                            options=_dropdown_options(
+                                                tuple(self.grouping_vars)
+                                            ),
                                         )
                                     ],
                                 ),
@@ -606,34 +888,99 @@ class QualityIndicatorEffektaveditering:
             grouping = []
         elif isinstance(grouping, str):
             grouping = [grouping]
-        edited = (
-            self.get_current_data()
-            .melt(id_vars=[self.ident_var, *grouping], value_vars=self.key_vars)
-            .groupby([*grouping, "variable"])
-            .agg({"value": "sum"})
-            .rename(columns={"value": "editert"})
-            .reset_index()
-        )
+        if not grouping:
+            # Without grouping the sums per variable are plain column sums. They are
+            # sorted by variable like the grouped sums were, so the card keeps
+            # showing the alphabetically first key variable.
+            edited = (
+                _get_data(self._shared_data, self.get_current_data)[self.key_vars]
+                .sum()
+                .rename_axis("variable")
+                .sort_index()
+            )
+            ueditert = (
+                _get_data(self._shared_data, self.get_original_data)[self.key_vars]
+                .sum()
+                .rename_axis("variable")
+                .sort_index()
+            )
+        else:
+            # Summing the key variables per group before reshaping means only the
+            # small aggregated frame is converted to long format.
+            edited = (
+                _get_data(self._shared_data, self.get_current_data)
+                .groupby(grouping, observed=True, sort=False)[self.key_vars]
+                .sum()
+                .reset_index()
+                .melt(id_vars=grouping, value_vars=self.key_vars)
+                .set_index([*grouping, "variable"])["value"]
+            )
+            ueditert = (
+                _get_data(self._shared_data, self.get_original_data)
+                .groupby(grouping, observed=True, sort=False)[self.key_vars]
+                .sum()
+                .reset_index()
+                .melt(id_vars=grouping, value_vars=self.key_vars)
+                .set_index([*grouping, "variable"])["value"]
+            )
 
-        ueditert = (
-            self.get_original_data()
-            .melt(id_vars=[self.ident_var, *grouping], value_vars=self.key_vars)
-            .groupby([*grouping, "variable"])
-            .agg({"value": "sum"})
-            .rename(columns={"value": "ueditert"})
-            .reset_index()
+        # Both sides are indexed by the same group keys, so aligning the indexes
+        # replaces a merge on the key columns.
+        edited, ueditert = edited.align(ueditert, join="inner")
+        editert_values = edited.to_numpy()
+        ueditert_values = ueditert.to_numpy()
+
+        merged = pd.DataFrame(
+            {
+                "editert": editert_values,
+                "ueditert": ueditert_values,
+                "effekt av editering": (ueditert_values - editert_values)
+                / editert_values
+                * 100,
+            },
+            index=edited.index,
+        ).reset_index()
+        # key_vars may name a variable more than once, which categories do not allow.
+        merged["variable"] = pd.Categorical(
+            merged["variable"], categories=list(dict.fromkeys(self.key_vars))
         )
+        return merged
 
-        merged = edited.merge(ueditert, on=[*grouping, "variable"])
+    def callbacks(self) -> None:
+        """Sets up callbacks for the indicator value and for opening and closing the detailed view."""
 
-        merged["effekt av editering"] = (
-            (merged["ueditert"] - merged["editert"]) / merged["editert"] * 100
+        @callback(  # type: ignore[misc]
+            Output("kvalitet-effekt-indicator", "figure"),
+            Output("kvalitet-effekt-computed", "data"),
+            Input("kvalitetsindikatorer-modal", "is_open"),
+            State("kvalitet-effekt-computed", "data"),
+            prevent_initial_call=True,
         )
+        def kvaliteteffekt_indicator(
+            is_open: bool, computed: bool
+        ) -> tuple[go.Figure, bool]:
+            """Calculates the effect of editing shown on the card the first time the quality indicator modal is opened.
 
-        return merged
+            Args:
+                is_open (bool): Whether the quality indicator modal is open.
+                computed (bool): Whether the card has already been calculated.
 
-    def callbacks(self) -> None:
-        """Sets up callbacks for opening and closing the detailed view."""
+            Returns:
+                tuple[go.Figure, bool]:
+                    - Figure showing the effect of editing.
+                    - True, to mark the card as calculated.
+
+            Raises:
+                PreventUpdate: If the modal is being closed or the card has already been calculated.
+            """
+            if not is_open or computed:
+                raise PreventUpdate
+            return (
+                _indicator_figure(
+                    self.get_comparison_data(self.periode)["effekt av editering"][0]
+                ),
+                True,
+            )
 
         @callback(  # type: ignore[misc]
             Output("effekt-modal", "is_open"),
@@ -694,10 +1041,13 @@ class QualityIndicatorTreffsikkerhet:
             Used to check against control outcomes to determine if a control outcome
             likely resulted in an edit.
             Example: [(orgnr_1, variabel_1), (orgnr_1, variabel_2), (orgnr_2, variabel_1)].
-        quality_report (QualityReport | None):
-            The quality report used for calculations.
+        quality_report (dict[str, Any] | QualityReport):
+            The quality report used for calculations, as read from `qualityreport_path` or as given.
         qualityreport_path (str | None):
             File path to a saved quality report in JSON format on Dapla.
+        treffsikkerhet (dict[str, float]):
+            The accuracy per control and in total. Calculated on first access and again
+            the first time the quality indicator modal is opened after each page load.
     """
 
     def __init__(
@@ -720,27 +1070,25 @@ class QualityIndicatorTreffsikkerhet:
             ValueError: If both `quality_report` and `qualityreport_path` are defined
                         or if neither is provided.
         """
-        if qualityreport_path and quality_report:
+        if qualityreport_path and quality_report is not None:
             raise ValueError(
                 "Remove either quality_report or qualityreport_path. QualityIndicatorTreffsikkerhet() requires that only one of quality_report and qualityreport_path is defined. If both are defined, it will not work."
             )
+        self.quality_report: dict[str, Any] | QualityReport
         if qualityreport_path:
-            import json
-
-            import dapla as dp
-
-            with dp.FileClient.gcs_open(qualityreport_path, "r") as outfile:
-                data = json.load(outfile)
-            self.quality_report = data
-        elif quality_report:
+            self.quality_report = _read_json_report(qualityreport_path)
+        elif quality_report is not None:
             self.quality_report = quality_report
         else:
             raise ValueError(
                 "Either quality_report or qualityreport_path needs to have a value."
             )
         self.get_edits_list_func = get_edits_list_func
-
-        self.treffsikkerhet = self.beregn_treffsikkerhet()
+        self._quality_report_dict: dict[str, Any] = (
+            self.quality_report.to_dict()
+            if isinstance(self.quality_report, QualityReport)
+            else self.quality_report
+        )
 
         self.card = html.Div(
             [
@@ -750,20 +1098,13 @@ class QualityIndicatorTreffsikkerhet:
                             [
                                 html.H5("26 - Treffsikkerhet", className="card-title"),
                                 dcc.Graph(
-                                    figure=go.Figure(
-                                        go.Indicator(
-                                            mode="number+delta",
-                                            value=self.treffsikkerhet["total"],
-                                            number={"prefix": ""},
-                                            # delta={"position": "bottom", "reference": self.editeringsandel(self.periode-1)}, # TODO
-                                            domain={"x": [0, 1], "y": [0, 1]},
-                                        )
-                                    ).update_layout(
-                                        height=150,
-                                        margin=dict(l=20, r=20, t=20, b=20),
-                                    ),
+                                    id="kvalitet-treffsikkerhet-indicator",
+                                    figure=_indicator_figure(0),
                                     config={"displayModeBar": False},
                                 ),
+                                dcc.Store(
+                                    id="kvalitet-treffsikkerhet-computed", data=False
+                                ),
                             ]
                         ),
                         dbc.CardFooter(
@@ -773,24 +1114,15 @@ class QualityIndicatorTreffsikkerhet:
                             )
                         ),
                     ],
-                    style={
-                        "width": "18rem",
-                        "margin": "10px",
-                    },
+                    style=_CARD_STYLE,
                 ),
                 dbc.Modal(
                     [
                         dbc.ModalHeader("26 - Treffsikkerhet"),
                         dbc.ModalBody(
                             [
-                                html.Div(
-                                    dcc.Graph(
-                                        figure=px.bar(
-                                            y=self.treffsikkerhet.keys(),
-                                            x=self.treffsikkerhet.values(),
-                                            orientation="h",
-                                        )
-                                    )
+                                dcc.Loading(
+                                    id="kvalitet-treffsikkerhet-details",
                                 ),
                             ]
                         ),
@@ -802,6 +1134,15 @@ class QualityIndicatorTreffsikkerhet:
 
         self.callbacks()
 
+    @cached_property
+    def treffsikkerhet(self) -> dict[str, float]:
+        """The accuracy indicator, calculated on first access and reused until it is recalculated for the card.
+
+        Returns:
+            dict: The result of `beregn_treffsikkerhet()`.
+        """
+        return self.beregn_treffsikkerhet()
+
     def beregn_treffsikkerhet(self) -> dict[str, float]:
         """Calculates the accuracy indicator based on the quality report.
 
@@ -809,37 +1150,99 @@ class QualityIndicatorTreffsikkerhet:
             dict: A dictionary where keys are control names and values are the accuracy percentage.
                   Includes a "total" key for overall accuracy.
         """
-        if isinstance(self.quality_report, QualityReport):
-            quality_report = self.quality_report.to_dict()
-        else:
-            quality_report = self.quality_report
-        edits = self.get_edits_list_func()
+        quality_report = self._quality_report_dict
+        # Edits are counted per cell, so a cell edited several times counts each edit.
+        edits = Counter(self.get_edits_list_func())
+        celler_markert_per_kontroll: defaultdict[str, set[tuple[str, str]]] = (
+            defaultdict(set)
+        )
+        for x in quality_report["kontrollutslag"]:
+            celler_markert_per_kontroll[x["kontrollnavn"]].update(
+                (x["observasjon_id"], var) for var in x["relevante_variabler"]
+            )
+        kontroller = quality_report["control_documentation"]
+        total_kontrollutslag = sum(kontroller[i]["Kontrollutslag"] for i in kontroller)
         treffsikkerhet = {}
-        total_kontrollutslag = 0
         total_celler_markert_editert = 0
-        for i in quality_report["control_documentation"]:
-            kontrollutslag = quality_report["control_documentation"][i][
-                "Kontrollutslag"
-            ]
-            total_kontrollutslag = total_kontrollutslag + kontrollutslag
-            celler_markert = [
-                (x["observasjon_id"], var)
-                for x in quality_report["kontrollutslag"]
-                if x["kontrollnavn"] == i
-                for var in x["relevante_variabler"]
-            ]
-            celler_markert_editert = len([x for x in edits if x in celler_markert])
-            total_celler_markert_editert = (
-                total_celler_markert_editert + celler_markert_editert
+        for i in kontroller:
+            kontrollutslag = kontroller[i]["Kontrollutslag"]
+            celler_markert_editert = sum(
+                edits[celle] for celle in celler_markert_per_kontroll.get(i, set())
+            )
+            total_celler_markert_editert += celler_markert_editert
+            treffsikkerhet[i] = (
+                (celler_markert_editert / kontrollutslag) * 100
+                if kontrollutslag
+                else 0.0
             )
-            treffsikkerhet[i] = (celler_markert_editert / kontrollutslag) * 100
         treffsikkerhet["total"] = (
-            total_celler_markert_editert / total_kontrollutslag
-        ) * 100
+            (total_celler_markert_editert / total_kontrollutslag) * 100
+            if total_kontrollutslag
+            else 0.0
+        )
         return treffsikkerhet
 
     def callbacks(self) -> None:
-        """Sets up callbacks for opening and closing the detailed view."""
+        """Sets up callbacks for the indicator value, the detailed view and opening and closing the detailed view."""
+
+        @callback(  # type: ignore[misc]
+            Output("kvalitet-treffsikkerhet-indicator", "figure"),
+            Output("kvalitet-treffsikkerhet-computed", "data"),
+            Input("kvalitetsindikatorer-modal", "is_open"),
+            State("kvalitet-treffsikkerhet-computed", "data"),
+            prevent_initial_call=True,
+        )
+        def kvalitettreffsikkerhet_indicator(
+            is_open: bool, computed: bool
+        ) -> tuple[go.Figure, bool]:
+            """Calculates the accuracy shown on the card the first time the quality indicator modal is opened.
+
+            Args:
+                is_open (bool): Whether the quality indicator modal is open.
+                computed (bool): Whether the card has already been calculated.
+
+            Returns:
+                tuple[go.Figure, bool]:
+                    - Figure showing the total accuracy.
+                    - True, to mark the card as calculated.
+
+            Raises:
+                PreventUpdate: If the modal is being closed or the card has already been calculated.
+            """
+            if not is_open or computed:
+                raise PreventUpdate
+            # The result may have been calculated for an earlier page load, before
+            # later edits were made.
+            self.__dict__.pop("treffsikkerhet", None)
+            return _indicator_figure(self.treffsikkerhet["total"]), True
+
+        @callback(  # type: ignore[misc]
+            Output("kvalitet-treffsikkerhet-details", "children"),
+            Input("treffsikkerhet-modal", "is_open"),
+            prevent_initial_call=True,
+        )
+        def kvalitettreffsikkerhet_detailed(is_open: bool) -> dcc.Graph:
+            """Creates the chart with the accuracy per control each time the detailed view is opened.
+
+            Args:
+                is_open (bool): Whether the detailed view is open.
+
+            Returns:
+                dcc.Graph: A bar chart displaying the accuracy for each control, without the total.
+
+            Raises:
+                PreventUpdate: If the detailed view is being closed.
+            """
+            if not is_open:
+                raise PreventUpdate
+            kontroller = [i for i in self.treffsikkerhet if i != "total"]
+            return dcc.Graph(
+                figure=px.bar(
+                    y=kontroller,
+                    x=[self.treffsikkerhet[i] for i in kontroller],
+                    orientation="h",
+                )
+            )
 
         @callback(  # type: ignore[misc]
             Output("treffsikkerhet-modal", "is_open"),
@@ -1,5 +1,11 @@
 import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from collections.abc import Hashable
+from functools import lru_cache
 from typing import Any
+from uuid import uuid4
 
 import dash_ag_grid as dag
 import dash_bootstrap_components as dbc
@@ -7,6 +13,7 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from dash import callback
+from dash import clientside_callback
 from dash import dcc
 from dash import html
 from dash.dependencies import Input
@@ -18,12 +25,83 @@ from ..utils.functions import sidebar_button
 
 logger = logging.getLogger(__name__)
 
+_MAX_CACHED_QUERIES = 16
+_MAX_CACHED_FIGURES = 32
+
+# Builds a figure from the data, the x and y columns and the hover data.
+_GRAPH_BUILDERS: dict[str, Callable[..., go.Figure]] = {
+    "scatter": lambda df, x, y, hover: px.scatter(df, x=x, y=y, hover_data=hover),
+    "box": lambda df, x, y, hover: px.box(df, x=x, y=y, points="all"),
+    "violin": lambda df, x, y, hover: px.violin(df, x=x, y=y, box=True, points="all"),
+    "line": lambda df, x, y, hover: px.line(df, x=x, y=y, hover_data=hover),
+    "bar": lambda df, x, y, hover: px.bar(df, x=x, y=y, hover_data=hover),
+    "histogram": lambda df, x, y, hover: px.histogram(df, x=x, y=y, hover_data=hover),
+}
+
+
+def _remember(cache: OrderedDict[Any, Any], key: Any, value: Any, maxsize: int) -> None:
+    """Stores a value in a bounded cache, evicting the least recently stored entry when full.
+
+    Args:
+        cache (OrderedDict): The cache to store the value in.
+        key (Any): The key to store the value under.
+        value (Any): The value to store.
+        maxsize (int): The maximum number of entries kept in the cache.
+    """
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > maxsize:
+        cache.popitem(last=False)
+
+
+def _single_column(columns: str | list[str]) -> str | list[str]:
+    """Unwraps a selection of exactly one column from a multi-select dropdown.
+
+    Args:
+        columns (str | list[str]): The selected column(s).
+
+    Returns:
+        str | list[str]: The column name if only one is selected, otherwise the selection unchanged.
+    """
+    if isinstance(columns, list) and len(columns) == 1:
+        return columns[0]
+    return columns
+
+
+@lru_cache(maxsize=64)
+def _column_metadata(
+    columns: tuple[str, ...],
+) -> tuple[list[dict[str, str]], list[dict[str, str]]]:
+    """Creates dropdown options and table column definitions for the columns of a query result.
+
+    Args:
+        columns (tuple[str, ...]): The columns of the query result.
+
+    Returns:
+        tuple: Contains:
+            - options (list[dict]): Dropdown options for the columns.
+            - columnDefs (list[dict]): Column definitions for the table.
+    """
+    options = []
+    column_defs = []
+    for col in columns:
+        options.append({"label": col, "value": col})
+        column_defs.append({"headerName": col, "field": col})
+    return options, column_defs
+
 
 class VisualizationBuilder:
     """A module for creating and visualizing data queries and graphs interactively.
 
     Attributes:
         database (object): The database connection or interface for executing queries.
+        _query_results (OrderedDict[str, pd.DataFrame]): The most recent query results, kept
+            server-side so the table data is not sent back from the browser to make graphs.
+            Each run of a query gets its own key, so sessions do not share results. A result
+            that has been evicted is fetched again by rerunning its query.
+        _figures (OrderedDict[tuple, go.Figure]): The most recent graphs made from the kept
+            query results, keyed by query run and selected columns and graph type.
+        _cache_lock (threading.Lock): Guards both caches, which are shared between requests.
     """
 
     def __init__(self, database: object) -> None:
@@ -38,15 +116,23 @@ class VisualizationBuilder:
         if not hasattr(database, "query"):
             raise TypeError("The provided object does not have a 'query' method.")
         self.database = database
+        self._query_results: OrderedDict[str, pd.DataFrame] = OrderedDict()
+        self._figures: OrderedDict[tuple[Any, ...], go.Figure] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._layout: html.Div | None = None
         self.callbacks()
 
     def layout(self) -> html.Div:
         """Generates the layout for the Visualiseringsbygger module.
 
+        The layout is static, so it is built on the first call and reused afterwards.
+
         Returns:
             html.Div: A Div element containing components for querying data and visualizing graphs.
         """
-        layout = html.Div(
+        if self._layout is not None:
+            return self._layout
+        self._layout = html.Div(
             [
                 dbc.Modal(
                     [
@@ -84,12 +170,15 @@ class VisualizationBuilder:
                                             ),
                                         ),
                                         html.Div(
-                                            dag.AgGrid(
-                                                id="sql-output-table",
-                                                className="ag-theme-alpine-dark header-style-on-filter",
-                                                columnSize="responsiveSizeToFit",
-                                                style={"pagination": True},
-                                            )
+                                            [
+                                                dag.AgGrid(
+                                                    id="sql-output-table",
+                                                    className="ag-theme-alpine-dark header-style-on-filter",
+                                                    columnSize="responsiveSizeToFit",
+                                                    style={"pagination": True},
+                                                ),
+                                                dcc.Store(id="sql-query-key"),
+                                            ]
                                         ),
                                         html.Div(
                                             style={
@@ -124,29 +213,10 @@ class VisualizationBuilder:
                                                     placeholder="graftype",
                                                     options=[
                                                         {
-                                                            "label": "scatter",
-                                                            "value": "scatter",
-                                                        },
-                                                        {
-                                                            "label": "box",
-                                                            "value": "box",
-                                                        },
-                                                        {
-                                                            "label": "violin",
-                                                            "value": "violin",
-                                                        },
-                                                        {
-                                                            "label": "line",
-                                                            "value": "line",
-                                                        },
-                                                        {
-                                                            "label": "bar",
-                                                            "value": "bar",
-                                                        },
-                                                        {
-                                                            "label": "histogram",
-                                                            "value": "histogram",
-                                                        },
+                                                            "label": graph_type,
+                                                            "value": graph_type,
+                                                        }
+                                                        for graph_type in _GRAPH_BUILDERS
                                                     ],
                                                     className="dbc",
                                                 ),
@@ -177,35 +247,123 @@ class VisualizationBuilder:
                 sidebar_button("🏗️", "Visualiseringsbygger", "sidebar-sql-button"),
             ],
         )
-        return layout
+        return self._layout
+
+    def _query_result(self, query_run: dict[str, str]) -> pd.DataFrame:
+        """Gets the kept result of a query run, running the query again if it has been evicted.
+
+        Args:
+            query_run (dict[str, str]): The key of the query run and the query itself.
+
+        Returns:
+            pd.DataFrame: The result of the query.
+        """
+        with self._cache_lock:
+            df = self._query_results.get(query_run["key"])
+        if df is None:
+            df = self.database.query(query_run["query"])
+            with self._cache_lock:
+                _remember(
+                    self._query_results, query_run["key"], df, _MAX_CACHED_QUERIES
+                )
+        return df
+
+    def run_query(
+        self, query: str, previous_run: dict[str, str] | None = None
+    ) -> tuple[pd.DataFrame, dict[str, str]]:
+        """Runs a query and keeps its result server-side under a key for this run.
+
+        Args:
+            query (str): The SQL query to run.
+            previous_run (dict[str, str] | None): The previous query run in the same session,
+                whose result and graphs are dropped. Defaults to None.
+
+        Returns:
+            tuple: Contains:
+                - df (pd.DataFrame): The result of the query.
+                - run (dict[str, str]): The key of this run of the query and the query itself.
+        """
+        df = self.database.query(query)
+        query_key = uuid4().hex
+        with self._cache_lock:
+            _remember(self._query_results, query_key, df, _MAX_CACHED_QUERIES)
+            # The previous result of this session can no longer be selected.
+            if previous_run:
+                previous_key = previous_run["key"]
+                self._query_results.pop(previous_key, None)
+                for key in [key for key in self._figures if key[0] == previous_key]:
+                    del self._figures[key]
+        return df, {"key": query_key, "query": query}
+
+    def make_graph(
+        self,
+        x_axis: str | list[str],
+        y_axis: str | list[str],
+        hover_data: str | list[str] | None,
+        graph_type: str,
+        query_run: dict[str, str],
+    ) -> dict[Any, Any] | go.Figure:
+        """Makes a graph of a query result from the selected columns and graph type.
+
+        Args:
+            x_axis (str | list[str]): The column(s) selected for the x-axis.
+            y_axis (str | list[str]): The column(s) selected for the y-axis.
+            hover_data (str | list[str] | None): The column(s) to display as hover data.
+            graph_type (str): The type of graph to make (e.g., "scatter", "bar").
+            query_run (dict[str, str]): The key and query of the query run to make the graph from.
+
+        Returns:
+            dict | go.Figure: A Plotly figure, or an empty dict for an unknown graph type.
+        """
+        figure_key = (
+            query_run["key"],
+            *(
+                tuple(selection) if isinstance(selection, list) else selection
+                for selection in (x_axis, y_axis, hover_data)
+            ),
+            graph_type,
+        )
+        with self._cache_lock:
+            fig = self._figures.get(figure_key)
+            if fig is not None:
+                self._figures.move_to_end(figure_key)
+                return fig
+        df = self._query_result(query_run)
+        x_axis = _single_column(x_axis)
+        y_axis = _single_column(y_axis)
+        if isinstance(x_axis, list) and isinstance(y_axis, list):
+            # plotly express can only take several columns on one of the axes.
+            y_axis = y_axis[0]
+        build_graph = _GRAPH_BUILDERS.get(graph_type)
+        if build_graph is None:
+            return {}
+        # The hover dropdown allows several columns, which plotly express takes
+        # as a flat list of column names.
+        if isinstance(hover_data, str):
+            hover_data = [hover_data]
+        fig = build_graph(df, x_axis, y_axis, hover_data or None)
+        with self._cache_lock:
+            _remember(self._figures, figure_key, fig, _MAX_CACHED_FIGURES)
+        return fig
 
     def callbacks(self) -> None:
         """Registers Dash callbacks for the Visualiseringsbygger module.
 
         Notes:
-            - `sqlmodal_toggle`: Toggles the visibility of the query modal.
-            - `sql_query`: Executes the SQL query and updates the table and dropdown options.
-            - `update_graph`: Generates graphs based on selected columns and graph type.
+            - A clientside callback toggles the visibility of the query modal without a round trip to the server.
+            - `sql_query`: Executes the SQL query with `run_query()` and updates the table and dropdown options.
+            - `update_graph`: Generates graphs with `make_graph()` based on selected columns and graph type.
         """
-
-        @callback(  # type: ignore[misc]
+        clientside_callback(
+            """
+            function(n, is_open) {
+                return n ? !is_open : is_open;
+            }
+            """,
             Output("sql-modal", "is_open"),
             Input("sidebar-sql-button", "n_clicks"),
             State("sql-modal", "is_open"),
         )
-        def sqlmodal_toggle(n: int, is_open: bool) -> bool:
-            """Toggles the visibility of the SQL query modal.
-
-            Args:
-                n (int): The number of clicks on the sidebar button.
-                is_open (bool): The current visibility state of the modal.
-
-            Returns:
-                bool: The new visibility state of the modal.
-            """
-            if n:
-                return not is_open
-            return is_open
 
         @callback(  # type: ignore[misc]
             Output("sql-output-table", "rowData"),
@@ -213,37 +371,43 @@ class VisualizationBuilder:
             Output("sql-x", "options"),
             Output("sql-y", "options"),
             Output("sql-hover", "options"),
+            Output("sql-query-key", "data"),
             Input("sql-button", "n_clicks"),
             State("sqlmodal-textarea", "value"),
+            State("sql-query-key", "data"),
         )
-        def sql_query(n_clicks: int, value: str) -> tuple[
-            list[dict[str, Any]],
+        def sql_query(
+            n_clicks: int, value: str, previous_run: dict[str, str] | None
+        ) -> tuple[
+            list[dict[Hashable, Any]],
             list[dict[str, str]],
             list[dict[str, str]],
             list[dict[str, str]],
             list[dict[str, str]],
+            dict[str, str],
         ]:
             """Executes an SQL query and updates table data and dropdown options.
 
             Args:
                 n_clicks (int): The number of clicks on the query execution button.
                 value (str): The SQL query string entered in the text area.
+                previous_run (dict | None): The key and query of the previous run in this session.
 
             Returns:
                 tuple: Contains:
                     - rowData (list[dict]): The table data.
                     - columnDefs (list[dict]): The column definitions for the table.
                     - x, y, hover options (list[dict]): Dropdown options for graph axes and hover data.
+                    - run (dict): The key of this run of the query and the query itself.
 
             Raises:
                 PreventUpdate: If n_clicks is None.
             """
             if not n_clicks:
                 raise PreventUpdate
-            df = self.database.query(f"""{value}""")
-            options = [{"label": col, "value": col} for col in df.columns]
-            columns = [{"headerName": col, "field": col} for col in df.columns]
-            return df.to_dict("records"), columns, options, options, options
+            df, query_run = self.run_query(value, previous_run)
+            options, columns = _column_metadata(tuple(df.columns))
+            return df.to_dict("records"), columns, options, options, options, query_run
 
         @callback(  # type: ignore[misc]
             Output("sql-graph1", "figure"),
@@ -251,16 +415,15 @@ class VisualizationBuilder:
             Input("sql-y", "value"),
             Input("sql-hover", "value"),
             Input("sql-graph-type", "value"),
-            State("sql-output-table", "rowData"),
-            State("sql-output-table", "columnDefs"),
+            State("sql-query-key", "data"),
+            prevent_initial_call=True,
         )
         def update_graph(
             x_axis: str | list[str],
             y_axis: str | list[str],
-            hover_data: str | list[dict[str, Any]],
+            hover_data: str | list[str] | None,
             graph_type: str,
-            rowdata: list[dict[str, Any]],
-            columndefs: list[dict[str, str]],
+            query_run: dict[str, str] | None,
         ) -> dict[Any, Any] | go.Figure:
             """Generates a graph based on the selected columns and graph type.
 
@@ -269,62 +432,16 @@ class VisualizationBuilder:
                 y_axis (str | list): The column(s) selected for the y-axis.
                 hover_data (str | list): The column(s) to display as hover data.
                 graph_type (str): The type of graph to generate (e.g., "scatter", "bar").
-                rowdata (list[dict]): The data displayed in the table.
-                columndefs (list[dict]): The column definitions for the table.
+                query_run (dict | None): The key and query of the query run shown in the table.
 
             Returns:
                 dict | go.Figure: A Plotly figure or an empty dict.
+
+            Raises:
+                PreventUpdate: If no query has been run yet.
             """
-            if x_axis and y_axis:
-                if isinstance(x_axis, list) and len(x_axis) == 1:
-                    x_axis = x_axis[0]
-                if isinstance(y_axis, list) and len(y_axis) == 1:
-                    y_axis = y_axis[0]
-                if (
-                    isinstance(x_axis, list)
-                    and len(x_axis) > 1
-                    and isinstance(y_axis, list)
-                    and len(y_axis) > 1
-                ):
-                    y_axis = y_axis[0]
-                df = pd.DataFrame(rowdata)
-                columns = [col["field"] for col in columndefs]
-                df.columns = columns
-                df.fillna(0)
-                if graph_type == "scatter":
-                    fig = px.scatter(
-                        df,
-                        x=x_axis,
-                        y=y_axis,
-                        hover_data=[hover_data] if hover_data else None,
-                    )
-                elif graph_type == "line":
-                    fig = px.line(
-                        df,
-                        x=x_axis,
-                        y=y_axis,
-                        hover_data=[hover_data] if hover_data else None,
-                    )
-                elif graph_type == "bar":
-                    fig = px.bar(
-                        df,
-                        x=x_axis,
-                        y=y_axis,
-                        hover_data=[hover_data] if hover_data else None,
-                    )
-                elif graph_type == "box":
-                    fig = px.box(df, x=x_axis, y=y_axis, points="all")
-                elif graph_type == "violin":
-                    fig = px.violin(df, x=x_axis, y=y_axis, box=True, points="all")
-                elif graph_type == "histogram":
-                    fig = px.histogram(
-                        df,
-                        x=x_axis,
-                        y=y_axis,
-                        hover_data=[hover_data] if hover_data else None,
-                    )
-                else:
-                    fig = {}
-                return fig
-            else:
+            if not (x_axis and y_axis and graph_type):
                 return {}
+            if not query_run:
+                raise PreventUpdate
+            return self.make_graph(x_axis, y_axis, hover_data, graph_type, query_run)
@@ -1,16 +1,60 @@
 import logging
+from typing import Any
 
 import dash_bootstrap_components as dbc
 from dash import Input
 from dash import Output
 from dash import State
 from dash import callback
+from dash import callback_context
+from dash import dcc
 from dash import html
 
 from ..utils.functions import sidebar_button
 
 logger = logging.getLogger(__name__)
 
+_ALERT_LEVEL_BUTTONS: dict[str, str | None] = {
+    "error_log_button_show_all": None,
+    "error_log_button_show_info": "info",
+    "error_log_button_show_warning": "warning",
+    "error_log_button_show_danger": "danger",
+}
+
+
+def _selected_level(triggered_id: Any, current_level: str | None) -> str | None:
+    """Finds the alert level to show after a callback was triggered.
+
+    Args:
+        triggered_id (Any): The id of the component that triggered the callback.
+        current_level (str | None): The level currently shown, None for all alerts.
+
+    Returns:
+        str | None: The level chosen by the filter button that triggered the callback,
+            or the current level if the callback was triggered by something else.
+    """
+    if triggered_id in _ALERT_LEVEL_BUTTONS:
+        return _ALERT_LEVEL_BUTTONS[triggered_id]
+    return current_level
+
+
+def _filter_alerts(
+    alerts: list[dict[str, Any]], level: str | None
+) -> list[dict[str, Any]]:
+    """Filters serialized alerts by their level.
+
+    Args:
+        alerts (list[dict[str, Any]]): The alerts in the log, as `dbc.Alert` components
+            serialized by Dash.
+        level (str | None): The level to show ("info", "warning" or "danger"), None for all.
+
+    Returns:
+        list[dict[str, Any]]: The alerts with the given level, in their original order.
+    """
+    if level is None:
+        return alerts
+    return [alert for alert in alerts if alert["props"].get("color") == level]
+
 
 class AlertHandler:
     """Handler class to manage and display alerts within the application.
@@ -20,6 +64,10 @@ class AlertHandler:
     - Filter alerts based on their type using buttons.
     - Maintain a modal interface for viewing alerts.
 
+    Alerts are added by prepending `dbc.Alert` components to the data of the
+    `error_log` store, which keeps the full log. The filter buttons only change
+    which alerts are displayed.
+
     Methods:
         layout(): Generates the layout for the alert modal and sidebar button.
         callbacks(): Defines and registers Dash callbacks for managing alerts.
@@ -75,7 +123,11 @@ class AlertHandler:
                                     ],
                                     className="mb-3",
                                 ),
-                                dbc.Row(html.Div(id="error_log"), className="g-3"),
+                                dbc.Row(
+                                    html.Div(id="error_log_display"), className="g-3"
+                                ),
+                                dcc.Store(id="error_log", data=[]),
+                                dcc.Store(id="error_log_level"),
                             ]
                         ),
                     ],
@@ -92,9 +144,9 @@ class AlertHandler:
 
         @callback(  # type: ignore[misc]
             Output("sidebar-alerts-button", "children"),
-            Input("error_log", "children"),
+            Input("error_log", "data"),
         )
-        def feilmelding_update_button_label(alerts: list[dbc.Alert]) -> str:
+        def feilmelding_update_button_label(alerts: list[dict[str, Any]]) -> str:
             """Updates the label on the button for opening error logs with the current number of errors.
 
             Args:
@@ -125,58 +177,43 @@ class AlertHandler:
             return is_open
 
         @callback(  # type: ignore[misc]
-            Output("error_log", "children"),
-            [
-                Input("error_log_button_show_all", "n_clicks"),
-                Input("error_log_button_show_info", "n_clicks"),
-                Input("error_log_button_show_warning", "n_clicks"),
-                Input("error_log_button_show_danger", "n_clicks"),
-            ],
-            State("error_log", "children"),
+            Output("error_log_display", "children"),
+            Output("error_log_level", "data"),
+            Input("error_log_button_show_all", "n_clicks"),
+            Input("error_log_button_show_info", "n_clicks"),
+            Input("error_log_button_show_warning", "n_clicks"),
+            Input("error_log_button_show_danger", "n_clicks"),
+            Input("error_log", "data"),
+            State("error_log_level", "data"),
         )
         def filter_alerts(
             show_all: int | None,
             show_info: int | None,
             show_warning: int | None,
             show_danger: int | None,
-            current_alerts: list[dbc.Alert] | None,
-        ) -> list[dbc.Alert]:
-            """Filter alerts based on the button clicked.
+            alerts: list[dict[str, Any]] | None,
+            current_level: str | None,
+        ) -> tuple[list[dict[str, Any]], str | None]:
+            """Show the alerts in the log with the level chosen by the filter buttons.
 
             Args:
                 show_all (int | None): Clicks for "Show All" button.
                 show_info (int | None): Clicks for "Show Info" button.
                 show_warning (int | None): Clicks for "Show Warning" button.
                 show_danger (int | None): Clicks for "Show Danger" button.
-                current_alerts (list[dbc.Alert] | None): Current list of alerts.
+                alerts (list[dict[str, Any]] | None): All alerts in the log.
+                current_level (str | None): The level currently shown, None for all alerts.
 
             Returns:
-                list[dbc.Alert]: Filtered alerts as a list of Dash components.
+                tuple: Contains:
+                    - alerts (list[dict[str, Any]]): The alerts to display.
+                    - level (str | None): The level now shown.
 
             Notes:
-                - If no filters are clicked, all alerts are displayed.
-                - Filters alerts by `level` ("info", "warning", "danger").
+                - The log itself is never filtered, so "Vis alle beskjeder" shows every
+                  alert again after another filter has been used.
+                - New alerts added to the log are shown with the current filter.
+                - Filters alerts by their color ("info", "warning", "danger").
             """
-            if not current_alerts:
-                return []
-
-            if show_info:
-                level = "info"
-            elif show_warning:
-                level = "warning"
-            elif show_danger:
-                level = "danger"
-            else:
-                return [
-                    dbc.Alert(alert["message"], color=alert["color"], dismissable=True)
-                    for alert in current_alerts
-                ]
-
-            filtered_alerts = [
-                alert for alert in current_alerts if alert.get("level") == level
-            ]
-
-            return [
-                dbc.Alert(alert["message"], color=alert["color"], dismissable=True)
-                for alert in filtered_alerts
-            ]
+            level = _selected_level(callback_context.triggered_id, current_level)
+            return _filter_alerts(alerts or [], level), level
@@ -1,12 +1,10 @@
 import logging
-from typing import Any
 
 import dash_bootstrap_components as dbc
 from dash import Dash
 from dash import Input
 from dash import Output
 from dash import State
-from dash.exceptions import PreventUpdate
 from dash_bootstrap_templates import load_figure_template
 
 logger = logging.getLogger(__name__)
@@ -19,6 +17,7 @@ theme_map = {
     "solar": dbc.themes.SOLAR,
     "flatly": dbc.themes.FLATLY,
 }
+_DBC_CSS = "https://cdn.jsdelivr.net/gh/AnnMarieW/dash-bootstrap-templates/dbc.min.css"
 
 
 def app_setup(port: int, service_prefix: str, domain: str, stylesheet: str) -> Dash:
@@ -36,7 +35,7 @@ def app_setup(port: int, service_prefix: str, domain: str, stylesheet: str) -> D
 
     Notes:
         - The function maps the `stylesheet` parameter to a Bootstrap theme using `theme_map`.
-        - A callback is registered within the app to toggle the visibility of an element
+        - A clientside callback is registered within the app to toggle the visibility of an element
           with the ID `main-varvelger` based on the number of clicks on `sidebar-varvelger-button`.
 
     Examples:
@@ -46,40 +45,27 @@ def app_setup(port: int, service_prefix: str, domain: str, stylesheet: str) -> D
     template = theme_map[stylesheet]
     load_figure_template([template])
 
-    dbc_css = (
-        "https://cdn.jsdelivr.net/gh/AnnMarieW/dash-bootstrap-templates/dbc.min.css"
-    )
-
     app = Dash(
         __name__,
         requests_pathname_prefix=f"{service_prefix}proxy/{port}/",
-        external_stylesheets=[theme_map[stylesheet], dbc_css],
+        external_stylesheets=[template, _DBC_CSS],
     )
 
-    @app.callback(  # type: ignore[misc]
+    app.clientside_callback(  # type: ignore[no-untyped-call]
+        """
+        function(n_clicks, style) {
+            if (!n_clicks) {
+                throw window.dash_clientside.PreventUpdate;
+            }
+            const hidden = (
+                style && Object.keys(style).length === 1 && style.display === "none"
+            );
+            return hidden ? {} : {display: "none"};
+        }
+        """,
         Output("main-varvelger", "style"),
         Input("sidebar-varvelger-button", "n_clicks"),
         State("main-varvelger", "style"),
     )
-    def toggle_varselector(n_clicks: int, style: dict[str, Any]) -> dict[str, Any]:
-        """Toggle the visibility of the `main-varselector` component.
-
-        Args:
-            n_clicks (int): The number of times the `sidebar-varvelger-button` is clicked.
-            style (dict): Current style dictionary for the `main-varvelger` component.
-
-        Returns:
-            dict: Updated style dictionary for `main-varvelger`.
-
-        Raises:
-            PreventUpdate: If click is None.
-        """
-        if not n_clicks:
-            raise PreventUpdate
-        if style == {"display": "none"}:
-            style = {}
-        else:
-            style = {"display": "none"}
-        return style
 
     return app
@@ -5,6 +5,17 @@ from dash import html
 
 logger = logging.getLogger(__name__)
 
+_SIDEBAR_ICON_STYLE = {"display": "block", "font-size": "1.4rem"}
+_SIDEBAR_TEXT_STYLE = {"display": "block", "font-size": "0.7rem"}
+_SIDEBAR_BUTTON_STYLE = {
+    "display": "flex",
+    "flex-direction": "column",
+    "align-items": "center",
+    "word-break": "break-all",
+    "margin-bottom": "5%",
+    "width": "100%",
+}
+
 
 def format_timespan(start: int | float, end: int | float) -> str:
     """Formats the elapsed time between two time points into a human-readable string.
@@ -49,24 +60,18 @@ def sidebar_button(
     Returns:
         html.Div: A Div containing the styled button.
     """
-    if additional_styling is None:
-        additional_styling = {}
     button = html.Div(
         dbc.Button(
             [
-                html.Span(icon, style={"display": "block", "font-size": "1.4rem"}),
-                html.Span(text, style={"display": "block", "font-size": "0.7rem"}),
+                html.Span(icon, style=_SIDEBAR_ICON_STYLE),
+                html.Span(text, style=_SIDEBAR_TEXT_STYLE),
             ],
             id=component_id,
-            style={
-                "display": "flex",
-                "flex-direction": "column",
-                "align-items": "center",
-                "word-break": "break-all",
-                "margin-bottom": "5%",
-                "width": "100%",
-                **additional_styling,
-            },
+            style=(
+                {**_SIDEBAR_BUTTON_STYLE, **additional_styling}
+                if additional_styling
+                else _SIDEBAR_BUTTON_STYLE
+            ),
         )
     )
     return button
@@ -0,0 +1,54 @@
+import json
+from typing import Any
+
+import dash_bootstrap_components as dbc
+import pytest
+from plotly.io.json import to_json_plotly
+
+from ssb_sirius_dash.setup.alert_handler import _filter_alerts
+from ssb_sirius_dash.setup.alert_handler import _selected_level
+
+
+def _serialized_alert(message: str, color: str) -> dict[str, Any]:
+    """Serializes an alert the way it is stored in the error log by the browser."""
+    alert: dict[str, Any] = json.loads(
+        to_json_plotly(dbc.Alert(message, color=color, dismissable=True))
+    )
+    return alert
+
+
+ALERTS = [
+    _serialized_alert("Info", "info"),
+    _serialized_alert("Advarsel", "warning"),
+    _serialized_alert("Feil", "danger"),
+]
+
+
+@pytest.mark.parametrize(
+    ("triggered_id", "expected"),
+    [
+        ("error_log_button_show_all", ["Info", "Advarsel", "Feil"]),
+        ("error_log_button_show_info", ["Info"]),
+        ("error_log_button_show_warning", ["Advarsel"]),
+        ("error_log_button_show_danger", ["Feil"]),
+    ],
+)
+def test_filter_alerts_by_button(triggered_id: str, expected: list[str]) -> None:
+    level = _selected_level(triggered_id, "info")
+
+    alerts = _filter_alerts(ALERTS, level)
+
+    assert [alert["props"]["children"] for alert in alerts] == expected
+
+
+def test_filter_alerts_keeps_level_for_other_triggers() -> None:
+    assert _selected_level("error_log", "warning") == "warning"
+    assert _selected_level("unknown-button", None) is None
+
+
+def test_show_all_after_filter_shows_full_log() -> None:
+    shown = _filter_alerts(ALERTS, _selected_level("error_log_button_show_info", None))
+    assert len(shown) == 1
+
+    shown = _filter_alerts(ALERTS, _selected_level("error_log_button_show_all", "info"))
+    assert len(shown) == 3
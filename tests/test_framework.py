@@ -0,0 +1,57 @@
+import datetime
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pandas as pd
+
+from ssb_sirius_dash.control.framework import QualityReport
+
+
+def _write_pandas(df: pd.DataFrame, gcs_path: str, file_format: str) -> None:
+    df.to_parquet(gcs_path)
+
+
+def _read_pandas(gcs_path: str, file_format: str, **kwargs: Any) -> pd.DataFrame:
+    return pd.read_parquet(gcs_path, **kwargs)
+
+
+@mock.patch("dapla.read_pandas", side_effect=_read_pandas)
+@mock.patch("dapla.write_pandas", side_effect=_write_pandas)
+def test_save_control_documentation_round_trip(
+    write_pandas_mock: mock.Mock, read_pandas_mock: mock.Mock, tmp_path: Path
+) -> None:
+    import dapla as dp
+
+    control_documentation: dict[str, Any] = {
+        "kontroll_1": {
+            "kontrolltype": "Ufullstendig",
+            "Enheter kontrollert": 10,
+            "Kontrollutslag": 2,
+        },
+        "kontroll_2": {
+            "kontrolltype": "Ugyldig",
+            "Enheter kontrollert": 5,
+            "Kontrollutslag": 0,
+        },
+    }
+    quality_report = QualityReport(
+        statistics_name="test",
+        quality_control_id="1",
+        data_location=["data.parquet"],
+        data_period="2024",
+        quality_control_datetime=datetime.datetime(2024, 1, 1),
+        quality_control_results=[],
+        quality_control_errors=[],
+        quality_control_documentation=control_documentation,
+    )
+    path = str(tmp_path / "kontrolldokumentasjon.parquet")
+
+    quality_report.save_control_documentation(path)
+    saved = dp.read_pandas(path, file_format="parquet")
+
+    write_pandas_mock.assert_called_once()
+    assert saved["kontroll_id"].tolist() == ["kontroll_1", "kontroll_2"]
+    assert saved["Kontrollutslag"].tolist() == [2, 0]
+    assert saved["Enheter kontrollert"].tolist() == [10, 5]
+    assert saved["periode"].tolist() == ["2024", "2024"]
@@ -0,0 +1,280 @@
+import datetime
+import threading
+import time
+from typing import Any
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from ssb_sirius_dash.control.framework import QualityReport
+from ssb_sirius_dash.modals.quality_indicators import QualityIndicator
+from ssb_sirius_dash.modals.quality_indicators import QualityIndicatorEditeringsandel
+from ssb_sirius_dash.modals.quality_indicators import QualityIndicatorEffektaveditering
+from ssb_sirius_dash.modals.quality_indicators import (
+    QualityIndicatorKontrollutslagsandel,
+)
+from ssb_sirius_dash.modals.quality_indicators import QualityIndicatorTreffsikkerhet
+
+CURRENT_DATA = pd.DataFrame(
+    {
+        "ident": ["1", "1", "2", "3", "4"],
+        "variabel": ["a", "b", "a", "a", "a"],
+        "nace": ["01", "01", "01", "02", "02"],
+        "endret": [True, False, False, None, True],
+    }
+)
+
+
+def test_editeringsandel_change_flag_var() -> None:
+    indicator = QualityIndicatorEditeringsandel(
+        lambda: CURRENT_DATA,
+        None,
+        var_name="variabel",
+        ident_var="ident",
+        grouping_vars=["nace"],
+        change_flag_var="endret",
+    )
+
+    assert indicator.editeringsandel() == 50.0
+
+    details = indicator.editeringsandel_details("nace").set_index("nace")
+    assert details.loc["01", "units"] == 2
+    assert details.loc["01", "edited_units"] == 1
+    assert details.loc["02", "edited_units"] == 1
+
+
+def test_editeringsandel_missing_change_flag_is_unchanged() -> None:
+    current_data = CURRENT_DATA.assign(
+        endret=pd.array([pd.NA, False, False, pd.NA, True], dtype="boolean")
+    )
+    indicator = QualityIndicatorEditeringsandel(
+        lambda: current_data,
+        None,
+        var_name="variabel",
+        ident_var="ident",
+        grouping_vars=["nace"],
+        change_flag_var="endret",
+    )
+
+    assert indicator.editeringsandel() == 25.0
+    details = indicator.editeringsandel_details(["nace"]).set_index("nace")
+    assert details.loc["01", "edited_units"] == 0
+    assert details.loc["02", "editeringsandel"] == 50.0
+
+
+def test_editeringsandel_get_unit_counts_func() -> None:
+    def get_unit_counts(group: list[str]) -> pd.DataFrame:
+        if not group:
+            return pd.DataFrame({"units": [4], "edited_units": [1]})
+        return pd.DataFrame(
+            {"nace": ["01", "02"], "units": [2, 2], "edited_units": [0, 1]}
+        )
+
+    def get_current_data() -> pd.DataFrame:
+        raise AssertionError("The data should be counted at the source.")
+
+    indicator = QualityIndicatorEditeringsandel(
+        get_current_data,
+        None,
+        var_name="variabel",
+        ident_var="ident",
+        grouping_vars=["nace"],
+        get_unit_counts_func=get_unit_counts,
+    )
+
+    assert indicator.editeringsandel() == 25.0
+    details = indicator.editeringsandel_details("nace")
+    assert details["editeringsandel"].tolist() == [0.0, 50.0]
+
+
+def test_editeringsandel_get_change_data_func() -> None:
+    indicator = QualityIndicatorEditeringsandel(
+        lambda: CURRENT_DATA,
+        lambda: CURRENT_DATA.loc[CURRENT_DATA["endret"].eq(True)],
+        var_name="variabel",
+        ident_var="ident",
+    )
+
+    assert indicator.editeringsandel() == 50.0
+
+
+def test_editeringsandel_requires_change_source() -> None:
+    with pytest.raises(ValueError):
+        QualityIndicatorEditeringsandel(
+            lambda: CURRENT_DATA,
+            None,
+            var_name="variabel",
+            ident_var="ident",
+        )
+
+
+def test_quality_indicator_shares_data_without_wrapping_functions() -> None:
+    calls = []
+
+    def get_current_data() -> pd.DataFrame:
+        calls.append(1)
+        time.sleep(0.05)
+        return CURRENT_DATA
+
+    indicator = QualityIndicatorEditeringsandel(
+        get_current_data,
+        None,
+        var_name="variabel",
+        ident_var="ident",
+        change_flag_var="endret",
+    )
+    QualityIndicator([indicator])
+    QualityIndicator([indicator])
+    assert indicator.get_current_data is get_current_data
+
+    threads = [threading.Thread(target=indicator.editeringsandel) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+
+
+def test_kontrollutslagsandel_from_quality_report() -> None:
+    control_documentation: dict[str, Any] = {
+        "kontroll_1": {"Enheter kontrollert": 10, "Kontrollutslag": 2},
+        "kontroll_2": {"Enheter kontrollert": 10, "Kontrollutslag": 0},
+    }
+    quality_report = QualityReport(
+        statistics_name="test",
+        quality_control_id="1",
+        data_location=["data.parquet"],
+        data_period="2024",
+        quality_control_datetime=datetime.datetime(2024, 1, 1),
+        quality_control_results=[],
+        quality_control_errors=[],
+        quality_control_documentation=control_documentation,
+    )
+    indicator = QualityIndicatorKontrollutslagsandel(
+        control_documentation=quality_report
+    )
+
+    total, detaljer = indicator.kontrollutslag()
+    assert total == 0.1
+    assert detaljer["kontrollutslagsandel"].tolist() == [0.2, 0.0]
+
+
+@mock.patch("dapla.read_pandas")
+def test_kontrollutslagsandel_from_parquet_path(read_pandas_mock: mock.Mock) -> None:
+    def read_pandas(gcs_path: str, file_format: str, **kwargs: Any) -> pd.DataFrame:
+        assert file_format == "parquet"
+        columns: list[str] = kwargs["columns"]
+        return pd.DataFrame(
+            {
+                "kontroll_id": ["kontroll_1"],
+                "Enheter kontrollert": [4],
+                "Kontrollutslag": [1],
+            }
+        )[columns]
+
+    read_pandas_mock.side_effect = read_pandas
+    indicator = QualityIndicatorKontrollutslagsandel(
+        qualityreport_path="gs://bucket/kontrolldokumentasjon.PARQUET"
+    )
+
+    read_pandas_mock.assert_called_once()
+    total, _ = indicator.kontrollutslag()
+    assert total == 0.25
+
+
+@mock.patch("ssb_sirius_dash.modals.quality_indicators._read_json_report")
+def test_treffsikkerhet_counts_each_edit(read_json_report_mock: mock.Mock) -> None:
+    read_json_report_mock.return_value = {
+        "kontrollutslag": [
+            {
+                "kontrollnavn": "kontroll_1",
+                "observasjon_id": "1",
+                "relevante_variabler": ["omsetning", "ansatte"],
+            },
+            {
+                "kontrollnavn": "kontroll_2",
+                "observasjon_id": "2",
+                "relevante_variabler": ["omsetning"],
+            },
+        ],
+        "control_documentation": {
+            "kontroll_1": {"Kontrollutslag": 2},
+            "kontroll_2": {"Kontrollutslag": 1},
+            "kontroll_3": {"Kontrollutslag": 0},
+        },
+    }
+    indicator = QualityIndicatorTreffsikkerhet(
+        lambda: [("1", "omsetning"), ("1", "omsetning"), ("3", "omsetning")],
+        qualityreport_path="gs://bucket/kvalitetsrapport.json",
+    )
+
+    treffsikkerhet = indicator.beregn_treffsikkerhet()
+    assert treffsikkerhet["kontroll_1"] == 100.0
+    assert treffsikkerhet["kontroll_2"] == 0.0
+    assert treffsikkerhet["kontroll_3"] == 0.0
+    assert treffsikkerhet["total"] == pytest.approx(200 / 3)
+
+
+def test_effektaveditering_comparison_data() -> None:
+    current_data = pd.DataFrame(
+        {
+            "ident": ["1", "2"],
+            "nace": ["01", "02"],
+            "omsetning": [10.0, 20.0],
+            "ansatte": [1.0, 2.0],
+        }
+    )
+    original_data = current_data.assign(omsetning=[12.0, 20.0])
+    indicator = QualityIndicatorEffektaveditering(
+        lambda: current_data,
+        lambda: original_data,
+        periode="2024",
+        ident_var="ident",
+        key_vars=["omsetning", "ansatte"],
+        grouping_vars="nace",
+    )
+
+    comparison = indicator.get_comparison_data("2024").set_index("variable")
+    assert comparison.loc["omsetning", "effekt av editering"] == pytest.approx(20 / 3)
+    assert comparison.loc["ansatte", "effekt av editering"] == 0.0
+
+    details = indicator.get_comparison_data("2024", "nace").set_index(
+        ["nace", "variable"]
+    )
+    assert details.loc[("01", "omsetning"), "effekt av editering"] == 20.0
+    assert details.loc[("02", "omsetning"), "effekt av editering"] == 0.0
+
+
+def test_effektaveditering_card_shows_first_variable_alphabetically() -> None:
+    current_data = pd.DataFrame(
+        {"ident": ["1", "2"], "omsetning": [10.0, 20.0], "ansatte": [1.0, 2.0]}
+    )
+    original_data = current_data.assign(omsetning=[12.0, 20.0], ansatte=[2.0, 2.0])
+    indicator = QualityIndicatorEffektaveditering(
+        lambda: current_data,
+        lambda: original_data,
+        periode="2024",
+        ident_var="ident",
+        key_vars=["omsetning", "ansatte"],
+        grouping_vars=[],
+    )
+
+    comparison = indicator.get_comparison_data("2024")
+    assert comparison["variable"].tolist() == ["ansatte", "omsetning"]
+    assert comparison["effekt av editering"][0] == pytest.approx(100 / 3)
+
+
+def test_effektaveditering_variable_is_categorical_with_repeated_key_vars() -> None:
+    current_data = pd.DataFrame({"ident": ["1", "2"], "omsetning": [10.0, 20.0]})
+    indicator = QualityIndicatorEffektaveditering(
+        lambda: current_data,
+        lambda: current_data,
+        periode="2024",
+        ident_var="ident",
+        key_vars=["omsetning", "omsetning"],
+        grouping_vars=[],
+    )
+
+    comparison = indicator.get_comparison_data("2024")
+    assert list(comparison["variable"].cat.categories) == ["omsetning"]
@@ -0,0 +1,55 @@
+import pandas as pd
+import plotly.graph_objects as go
+
+from ssb_sirius_dash.modals.visualizationbuilder import VisualizationBuilder
+
+QUERY_RESULT = pd.DataFrame(
+    {
+        "orgnr": ["1", "2", "3"],
+        "nace": ["01", "01", "02"],
+        "omsetning": [10, 20, 30],
+        "ansatte": [1, 2, 3],
+    }
+)
+
+
+class Database:
+    def __init__(self) -> None:
+        """Records the queries that are run."""
+        self.queries: list[str] = []
+
+    def query(self, query: str) -> pd.DataFrame:
+        self.queries.append(query)
+        return QUERY_RESULT
+
+
+def test_make_graph_with_several_hover_columns() -> None:
+    builder = VisualizationBuilder(Database())
+
+    _, query_run = builder.run_query("SELECT * FROM tabell")
+    figure = builder.make_graph(
+        ["omsetning"], ["ansatte"], ["orgnr", "nace"], "scatter", query_run
+    )
+    assert isinstance(figure, go.Figure)
+
+    assert figure.data[0].customdata.tolist() == [
+        ["1", "01"],
+        ["2", "01"],
+        ["3", "02"],
+    ]
+    hovertemplate = figure.data[0].hovertemplate
+    assert "orgnr" in hovertemplate
+    assert "nace" in hovertemplate
+
+
+def test_make_graph_reruns_evicted_query() -> None:
+    database = Database()
+    builder = VisualizationBuilder(database)
+
+    _, query_run = builder.run_query("SELECT * FROM tabell")
+    builder._query_results.clear()
+    figure = builder.make_graph("omsetning", "ansatte", None, "bar", query_run)
+    assert isinstance(figure, go.Figure)
+
+    assert database.queries == ["SELECT * FROM tabell", "SELECT * FROM tabell"]
+    assert figure.data[0].y.tolist() == [1, 2, 3]